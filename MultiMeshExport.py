@@ -16,6 +16,9 @@ import adsk.fusion
 import traceback
 import os
 import json
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -27,6 +30,13 @@ _ui: adsk.core.UserInterface = None
 _handlers = []                  # prevent GC of event handlers
 _updating = False               # guard against recursive input-changed events
 _custom_names = {}              # body entityToken → user-chosen save name
+_settings_cache = None          # parsed settings.json (see _load_settings)
+_settings_mtime = 0             # mtime of settings.json when cached
+_all_bodies_cache = None        # bodies in the design when the dialog opened
+_all_bodies_count = 0           # len(_all_bodies_cache)
+_name_tokens = []               # entityTokens backing the save-name rows
+_downloads_dir = None           # resolved on first use
+_verified_output_dir = None     # last export folder known to exist
 
 CMD_ID   = 'multiMeshExportCmd'
 CMD_NAME = 'Multi Mesh Export'
@@ -38,28 +48,50 @@ QUALITY = {
     'Low':    adsk.fusion.MeshRefinementSettings.MeshRefinementLow,
 }
 
+# Export loop: minimum seconds between UI event pumps / cancel checks
+_PUMP_INTERVAL = 0.05
+
+# Characters that are illegal in Windows / macOS file names
+_ILLEGAL_TRANS = str.maketrans('', '', r'\/:*?"<>|')
+
 _SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                               'settings.json')
 
 
 def _load_settings():
-    """Load persisted settings from disk (returns dict)."""
+    """Load persisted settings (returns dict).
+
+    The parsed file is cached in memory and only re-read when its mtime
+    changes on disk.
+    """
+    global _settings_cache, _settings_mtime
+    try:
+        mtime = os.stat(_SETTINGS_FILE).st_mtime
+    except OSError:
+        mtime = 0
+    if _settings_cache is not None and mtime == _settings_mtime:
+        return _settings_cache
     try:
         with open(_SETTINGS_FILE, 'r') as f:
-            return json.load(f)
+            _settings_cache = json.load(f)
     except Exception:
-        return {}
+        _settings_cache = {}
+    _settings_mtime = mtime
+    return _settings_cache
 
 
 def _save_settings(data):
     """Merge *data* into the persisted settings file."""
-    settings = _load_settings()
+    global _settings_cache, _settings_mtime
+    settings = dict(_load_settings())
     settings.update(data)
     try:
         with open(_SETTINGS_FILE, 'w') as f:
             json.dump(settings, f, indent=2)
+        _settings_mtime = os.stat(_SETTINGS_FILE).st_mtime
+        _settings_cache = settings
     except Exception:
-        pass
+        _settings_cache = None      # file may be partially written; re-read
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -67,44 +99,127 @@ def _save_settings(data):
 # ──────────────────────────────────────────────────────────────────────────────
 def _downloads_folder():
     """Return the current user's Downloads folder."""
-    return str(Path.home() / 'Downloads')
+    global _downloads_dir
+    if _downloads_dir is None:
+        _downloads_dir = str(Path.home() / 'Downloads')
+    return _downloads_dir
 
 
 def _all_bodies(design):
     """Collect every BRepBody from every component in the design."""
-    bodies = []
-    for comp in design.allComponents:
-        for body in comp.bRepBodies:
-            bodies.append(body)
-    return bodies
+    return [body for comp in design.allComponents for body in comp.bRepBodies]
 
 
 def _safe_filename(name):
     """Strip characters that are illegal in Windows / macOS file names."""
-    return ''.join(c for c in name if c not in r'\/:*?"<>|').strip() or 'body'
+    return name.translate(_ILLEGAL_TRANS).strip() or 'body'
+
+
+def _remove_existing(fpath):
+    """Delete *fpath* if it exists; return True when a file was removed."""
+    try:
+        os.remove(fpath)
+        return True
+    except OSError:             # missing (the common case) or locked
+        return False
 
 
 def _rebuild_name_list(inputs):
-    """Rebuild the editable save-name list to match the current body selection."""
+    """Sync the editable save-name list with the current body selection.
+
+    Rows are keyed by position, so only the rows after the first body that
+    differs from the previous selection are removed and re-created.
+    """
+    global _name_tokens
     sel = adsk.core.SelectionCommandInput.cast(inputs.itemById('bodySelection'))
     group = adsk.core.GroupCommandInput.cast(inputs.itemById('bodyListGroup'))
     if not sel or not group:
         return
 
+    entities = [sel.selection(i).entity for i in range(sel.selectionCount)]
+    tokens = [body.entityToken for body in entities]
+    if tokens == _name_tokens:
+        return
+
+    # Length of the unchanged leading run
+    keep = 0
+    for old, new in zip(_name_tokens, tokens):
+        if old != new:
+            break
+        keep += 1
+
     children = group.children
 
-    # Remove old rows
-    while children.count > 0:
+    # Remove stale trailing rows
+    while children.count > keep:
         children.item(children.count - 1).deleteMe()
 
-    # Create one editable name field per selected body
-    for i in range(sel.selectionCount):
-        body = sel.selection(i).entity
-        token = body.entityToken
-        default = _custom_names.get(token, _safe_filename(body.name))
+    # Create one editable name field per newly selected body
+    for i in range(keep, len(tokens)):
+        body = entities[i]
+        default = _custom_names.get(tokens[i], _safe_filename(body.name))
         children.addStringValueInput(
             'saveName_{}'.format(i), body.name, default)
 
+    _name_tokens = tokens
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Input-Changed Handlers (dispatched by input id from _OnInputChanged)
+# ──────────────────────────────────────────────────────────────────────────────
+def _handle_select_all(changed, inputs):
+    """Select / deselect every body in the design."""
+    sel = inputs.itemById('bodySelection')
+    chk = adsk.core.BoolValueCommandInput.cast(changed)
+    if chk.value:
+        for body in _all_bodies_cache or ():
+            try:
+                sel.addSelection(body)
+            except Exception:
+                pass        # suppressed / invisible bodies
+    else:
+        sel.clearSelection()
+    _rebuild_name_list(inputs)
+
+
+def _handle_body_sel(changed, inputs):
+    """Keep "Select All" in sync with manual selection."""
+    sel = adsk.core.SelectionCommandInput.cast(changed)
+    chk = inputs.itemById('selectAll')
+    chk.value = (_all_bodies_count > 0
+                 and sel.selectionCount == _all_bodies_count)
+    _rebuild_name_list(inputs)
+
+
+def _handle_save_name(changed, inputs):
+    """Remember the custom name when the user edits a row."""
+    idx = int(changed.id.split('_')[1])
+    if idx < len(_name_tokens):
+        _custom_names[_name_tokens[idx]] = (
+            adsk.core.StringValueCommandInput.cast(changed).value)
+
+
+def _handle_browse(changed, inputs):
+    """Browse for the export folder."""
+    chk = adsk.core.BoolValueCommandInput.cast(changed)
+    if chk.value:
+        dlg = _ui.createFolderDialog()
+        dlg.title = 'Choose Export Folder'
+        path_inp = adsk.core.StringValueCommandInput.cast(
+            inputs.itemById('outputPath'))
+        if os.path.isdir(path_inp.value):
+            dlg.initialDirectory = path_inp.value
+        if dlg.showDialog() == adsk.core.DialogResults.DialogOK:
+            path_inp.value = dlg.folder
+        chk.value = False       # reset so it can be clicked again
+
+
+_INPUT_DISPATCH = {
+    'selectAll':     _handle_select_all,
+    'bodySelection': _handle_body_sel,
+    'browseFolder':  _handle_browse,
+}
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Event Handlers
@@ -113,6 +228,7 @@ class _OnCommandCreated(adsk.core.CommandCreatedEventHandler):
     """Build the command dialog UI."""
 
     def notify(self, args):
+        global _all_bodies_cache, _all_bodies_count, _name_tokens
         try:
             cmd    = args.command
             cmd.isRepeatable = False
@@ -128,6 +244,11 @@ class _OnCommandCreated(adsk.core.CommandCreatedEventHandler):
                 )
                 return
 
+            # The body set cannot change while the dialog is open, so walk
+            # the component tree once here instead of on every click.
+            _all_bodies_cache = _all_bodies(design)
+            _all_bodies_count = len(_all_bodies_cache)
+
             # ── Body selection (multi-select, bodies only) ──
             sel = inputs.addSelectionInput(
                 'bodySelection', 'Bodies',
@@ -141,6 +262,7 @@ class _OnCommandCreated(adsk.core.CommandCreatedEventHandler):
 
             # ── Editable save names (populated when bodies are selected) ──
             _custom_names.clear()
+            _name_tokens = []
             group = inputs.addGroupCommandInput('bodyListGroup',
                                                 'Export Names')
             group.isExpanded = True
@@ -176,62 +298,15 @@ class _OnInputChanged(adsk.core.InputChangedEventHandler):
         global _updating
         if _updating:
             return
+        changed = args.input
+        handler = _INPUT_DISPATCH.get(changed.id)
+        if handler is None:
+            if not changed.id.startswith('saveName_'):
+                return          # quality, outputPath keystrokes, …
+            handler = _handle_save_name
         _updating = True
         try:
-            changed = args.input
-            inputs  = args.inputs
-
-            # ── Select All toggle ──
-            if changed.id == 'selectAll':
-                sel = inputs.itemById('bodySelection')
-                chk = adsk.core.BoolValueCommandInput.cast(changed)
-                design = adsk.fusion.Design.cast(_app.activeProduct)
-                if not design:
-                    return
-                if chk.value:
-                    for body in _all_bodies(design):
-                        try:
-                            sel.addSelection(body)
-                        except Exception:
-                            pass        # suppressed / invisible bodies
-                else:
-                    sel.clearSelection()
-                _rebuild_name_list(inputs)
-
-            # ── Keep "Select All" in sync with manual selection ──
-            elif changed.id == 'bodySelection':
-                sel = adsk.core.SelectionCommandInput.cast(changed)
-                chk = inputs.itemById('selectAll')
-                design = adsk.fusion.Design.cast(_app.activeProduct)
-                if design:
-                    total = len(_all_bodies(design))
-                    chk.value = (total > 0 and sel.selectionCount == total)
-                _rebuild_name_list(inputs)
-
-            # ── Save custom name when the user edits a row ──
-            elif changed.id.startswith('saveName_'):
-                idx = int(changed.id.split('_')[1])
-                sel = adsk.core.SelectionCommandInput.cast(
-                    inputs.itemById('bodySelection'))
-                if sel and idx < sel.selectionCount:
-                    body = sel.selection(idx).entity
-                    _custom_names[body.entityToken] = (
-                        adsk.core.StringValueCommandInput.cast(changed).value)
-
-            # ── Browse for folder ──
-            elif changed.id == 'browseFolder':
-                chk = adsk.core.BoolValueCommandInput.cast(changed)
-                if chk.value:
-                    dlg = _ui.createFolderDialog()
-                    dlg.title = 'Choose Export Folder'
-                    path_inp = adsk.core.StringValueCommandInput.cast(
-                        inputs.itemById('outputPath'))
-                    if os.path.isdir(path_inp.value):
-                        dlg.initialDirectory = path_inp.value
-                    if dlg.showDialog() == adsk.core.DialogResults.DialogOK:
-                        path_inp.value = dlg.folder
-                    chk.value = False       # reset so it can be clicked again
-
+            handler(changed, args.inputs)
         except Exception:
             _ui.messageBox(traceback.format_exc())
         finally:
@@ -261,6 +336,7 @@ class _OnExecute(adsk.core.CommandEventHandler):
     """Perform the actual STL export for every selected body."""
 
     def notify(self, args):
+        global _verified_output_dir
         try:
             inputs   = args.command.commandInputs
             sel      = adsk.core.SelectionCommandInput.cast(
@@ -279,7 +355,10 @@ class _OnExecute(adsk.core.CommandEventHandler):
                 _ui.messageBox('No bodies selected.', CMD_NAME)
                 return
 
-            os.makedirs(output_dir, exist_ok=True)
+            dir_checked = output_dir != _verified_output_dir
+            if dir_checked:
+                os.makedirs(output_dir, exist_ok=True)
+                _verified_output_dir = output_dir
             _save_settings({'outputPath': output_dir})
 
             design     = adsk.fusion.Design.cast(_app.activeProduct)
@@ -289,38 +368,34 @@ class _OnExecute(adsk.core.CommandEventHandler):
             group = adsk.core.GroupCommandInput.cast(
                 inputs.itemById('bodyListGroup'))
             children = group.children if group else None
+            name_inputs = {}
+            if children:
+                for k in range(children.count):
+                    inp = children.item(k)
+                    name_inputs[inp.id] = inp
 
             raw_names = []
             for i, body in enumerate(bodies):
-                if children and i < children.count:
-                    inp = children.itemById('saveName_{}'.format(i))
-                    raw = inp.value if inp else body.name
-                else:
-                    raw = body.name
+                inp = name_inputs.get('saveName_{}'.format(i))
+                raw = inp.value if inp else body.name
                 raw_names.append(_safe_filename(raw))
 
-            name_count = {}
-            for n in raw_names:
-                name_count[n] = name_count.get(n, 0) + 1
+            name_count = Counter(raw_names)
 
+            prefix      = os.path.join(output_dir, '')     # ends in a separator
             name_idx    = {}
             export_jobs = []        # list of (body, filepath)
             for body, n in zip(bodies, raw_names):
                 idx = name_idx.get(n, 0) + 1
                 name_idx[n] = idx
-                fname = '{} ({})'.format(n, idx) if name_count[n] > 1 else n
-                export_jobs.append(
-                    (body, os.path.join(output_dir, fname + '.stl')))
+                fname = f'{n} ({idx}).stl' if name_count[n] > 1 else f'{n}.stl'
+                export_jobs.append((body, prefix + fname))
 
             # ── Phase 1: Remove existing files (always overwrite) ────────
-            overwritten = 0
-            for _body, fpath in export_jobs:
-                if os.path.exists(fpath):
-                    try:
-                        os.remove(fpath)
-                        overwritten += 1
-                    except OSError:
-                        pass
+            # Pure file-system work (no Fusion API), so it can run in parallel
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                overwritten = sum(pool.map(
+                    _remove_existing, [fpath for _body, fpath in export_jobs]))
 
             # ── Phase 2: Export with progress bar ────────────────────────
             total     = len(export_jobs)
@@ -334,21 +409,48 @@ class _OnExecute(adsk.core.CommandEventHandler):
                       0, total, 0)
             adsk.doEvents()
 
-            exported = 0
-            errors   = []
+            exported   = 0
+            errors     = []
+            opts       = None
+            reuse_opts = True       # cleared if retargeted options fail
 
+            # The Fusion API is not thread-safe, so exports stay serial
+            last_pump = time.monotonic()
             for i, (body, fpath) in enumerate(export_jobs):
-                adsk.doEvents()
-                if prog.wasCancelled:
-                    cancelled = True
-                    break
-                prog.progressValue = i
-                adsk.doEvents()
+                now = time.monotonic()
+                if now - last_pump > _PUMP_INTERVAL:
+                    prog.progressValue = i
+                    adsk.doEvents()
+                    last_pump = now
+                    if prog.wasCancelled:
+                        cancelled = True
+                        break
 
                 try:
-                    opts = export_mgr.createSTLExportOptions(body, fpath)
-                    opts.meshRefinement = quality
-                    export_mgr.execute(opts)
+                    done = False
+                    if opts is not None and reuse_opts:
+                        try:
+                            opts.geometry = body
+                            opts.filename = fpath
+                            export_mgr.execute(opts)
+                            done = True
+                        except Exception:
+                            # Retargeted options were rejected; create fresh
+                            # options for this and every remaining body
+                            reuse_opts = False
+                    if not done:
+                        opts = export_mgr.createSTLExportOptions(body, fpath)
+                        opts.meshRefinement = quality
+                        try:
+                            export_mgr.execute(opts)
+                        except Exception:
+                            if dir_checked:
+                                raise
+                            # The folder may have been removed since it was
+                            # last verified; re-create it and retry once
+                            dir_checked = True
+                            os.makedirs(output_dir, exist_ok=True)
+                            export_mgr.execute(opts)
                     exported += 1
                 except Exception as ex:
                     errors.append('{}: {}'.format(body.name, ex))
@@ -363,7 +465,7 @@ class _OnExecute(adsk.core.CommandEventHandler):
                 msg.append('Overwritten: {}'.format(overwritten))
             if errors:
                 msg.append('Errors:   {}'.format(len(errors)))
-                msg.extend('  \u2022 {}'.format(e) for e in errors)
+                msg.append('  \u2022 ' + '\n  \u2022 '.join(errors))
             if cancelled:
                 msg.append('\nExport cancelled by user.')
             msg.append('\nLocation: {}'.format(output_dir))
@@ -411,6 +513,7 @@ def run(context):
 
 def stop(context):
     """Called by Fusion 360 when the add-in is stopped."""
+    global _all_bodies_cache, _all_bodies_count
     try:
         panel = _ui.allToolbarPanels.itemById('SolidScriptsAddinsPanel')
         if panel:
@@ -423,6 +526,8 @@ def stop(context):
             defn.deleteMe()
 
         _handlers.clear()
+        _all_bodies_cache = None
+        _all_bodies_count = 0
 
     except Exception:
         if _ui: